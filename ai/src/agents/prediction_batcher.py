@@ -0,0 +1,82 @@
+"""
+Shared ML inference batcher for Solace trading agents.
+
+Single-sample LSTM/DQN forward passes are overhead-bound: runtime is
+nearly insensitive to batch size, so predictions requested by many
+symbols or agents in the same window can be coalesced into one forward
+pass at close to zero marginal cost. Agents enqueue feature tensors on a
+shared queue; a central task drains it every few milliseconds (or as
+soon as a full batch accumulates) and fans the per-row results back
+through futures.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionBatcher:
+    """Coalesces per-agent prediction requests into batched forward passes"""
+
+    def __init__(self, model, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the background batching task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the background batching task"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def predict(self, features: torch.Tensor) -> torch.Tensor:
+        """Submit one (1, n_features) sample and await its prediction row"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((features, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block for the first request, then drain until the batch is
+            # full or the wait budget is spent
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                inputs = torch.cat([features for features, _ in batch], dim=0)
+                with torch.inference_mode():
+                    outputs = self.model(inputs)
+                for i, (_, future) in enumerate(batch):
+                    if not future.done():
+                        future.set_result(outputs[i:i + 1])
+            except Exception as e:
+                logger.error("Error in batched prediction: %s", e)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
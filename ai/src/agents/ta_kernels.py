@@ -0,0 +1,344 @@
+"""
+Numba-accelerated technical indicator kernels for Solace trading agents.
+
+Each kernel consumes raw float64 NumPy arrays and returns only the most
+recent scalar value(s). This replaces the previous pandas/`ta` pipeline,
+which rebuilt a DataFrame and full-history rolling windows on every tick
+only to keep the last row.
+"""
+
+from collections import deque
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def sma(arr, n):
+    """Simple moving average over the last n samples"""
+    if arr.shape[0] < n:
+        n = arr.shape[0]
+    total = 0.0
+    for i in range(arr.shape[0] - n, arr.shape[0]):
+        total += arr[i]
+    return total / n
+
+
+@njit(cache=True, nogil=True)
+def ema(arr, n):
+    """Exponential moving average with span n"""
+    alpha = 2.0 / (n + 1.0)
+    value = arr[0]
+    for i in range(1, arr.shape[0]):
+        value = alpha * arr[i] + (1.0 - alpha) * value
+    return value
+
+
+@njit(cache=True, nogil=True)
+def rsi(arr, n):
+    """Relative strength index with Wilder smoothing"""
+    if arr.shape[0] < n + 1:
+        return 50.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n + 1):
+        change = arr[i] - arr[i - 1]
+        if change > 0.0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= n
+    avg_loss /= n
+    for i in range(n + 1, arr.shape[0]):
+        change = arr[i] - arr[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        avg_gain = (avg_gain * (n - 1) + gain) / n
+        avg_loss = (avg_loss * (n - 1) + loss) / n
+    if avg_loss == 0.0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100.0 - 100.0 / (1.0 + rs)
+
+
+@njit(cache=True, nogil=True)
+def macd(arr):
+    """MACD line, signal line and histogram (12/26/9)"""
+    alpha_fast = 2.0 / 13.0
+    alpha_slow = 2.0 / 27.0
+    alpha_signal = 2.0 / 10.0
+    ema_fast = arr[0]
+    ema_slow = arr[0]
+    signal = 0.0
+    for i in range(1, arr.shape[0]):
+        ema_fast = alpha_fast * arr[i] + (1.0 - alpha_fast) * ema_fast
+        ema_slow = alpha_slow * arr[i] + (1.0 - alpha_slow) * ema_slow
+        line = ema_fast - ema_slow
+        signal = alpha_signal * line + (1.0 - alpha_signal) * signal
+    line = ema_fast - ema_slow
+    return line, signal, line - signal
+
+
+@njit(cache=True, nogil=True)
+def bbands(arr, n):
+    """Bollinger bands (upper, middle, lower) over the last n samples"""
+    if arr.shape[0] < n:
+        n = arr.shape[0]
+    total = 0.0
+    for i in range(arr.shape[0] - n, arr.shape[0]):
+        total += arr[i]
+    mean = total / n
+    var = 0.0
+    for i in range(arr.shape[0] - n, arr.shape[0]):
+        diff = arr[i] - mean
+        var += diff * diff
+    std = np.sqrt(var / n)
+    return mean + 2.0 * std, mean, mean - 2.0 * std
+
+
+@njit(cache=True, nogil=True)
+def vwap(close, vol):
+    """Volume-weighted average price"""
+    pv = 0.0
+    v = 0.0
+    for i in range(close.shape[0]):
+        pv += close[i] * vol[i]
+        v += vol[i]
+    if v == 0.0:
+        return 0.0
+    return pv / v
+
+
+@njit(cache=True, nogil=True)
+def market_stats(prices):
+    """Tail SMA20, tail SMA50, return std and 20-sample return in one pass"""
+    n = prices.shape[0]
+    w20 = 20 if n >= 20 else n
+    w50 = 50 if n >= 50 else n
+    sum20 = 0.0
+    sum50 = 0.0
+    # Welford accumulators over simple returns
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        if i >= n - w20:
+            sum20 += prices[i]
+        if i >= n - w50:
+            sum50 += prices[i]
+        if i > 0 and prices[i - 1] != 0.0:
+            ret = prices[i] / prices[i - 1] - 1.0
+            count += 1
+            delta = ret - mean
+            mean += delta / count
+            m2 += delta * (ret - mean)
+    ret_std = np.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+    ret20 = 0.0
+    if n >= 20 and prices[n - 20] != 0.0:
+        ret20 = (prices[n - 1] - prices[n - 20]) / prices[n - 20]
+    return sum20 / w20, sum50 / w50, ret_std, ret20
+
+
+@njit(cache=True, nogil=True)
+def returns_stats(prices, rets, out):
+    """Fill out[0:6] with mean/std/min/max/q25/q75 of simple returns
+
+    rets is caller-provided scratch of at least len(prices) - 1 samples,
+    so the kernel itself never allocates.
+    """
+    n = prices.shape[0] - 1
+    if n <= 0:
+        for i in range(6):
+            out[i] = 0.0
+        return
+    mean = 0.0
+    m2 = 0.0
+    lo = np.inf
+    hi = -np.inf
+    for i in range(n):
+        ret = (prices[i + 1] - prices[i]) / prices[i]
+        rets[i] = ret
+        delta = ret - mean
+        mean += delta / (i + 1)
+        m2 += delta * (ret - mean)
+        if ret < lo:
+            lo = ret
+        if ret > hi:
+            hi = ret
+    out[0] = mean
+    out[1] = np.sqrt(m2 / n) if n > 0 else 0.0
+    out[2] = lo
+    out[3] = hi
+    # O(n) quartile selection instead of a full percentile sort
+    k25 = int(0.25 * (n - 1))
+    k75 = int(0.75 * (n - 1))
+    part = np.partition(rets[:n], k25)
+    out[4] = part[k25]
+    part = np.partition(part, k75)
+    out[5] = part[k75]
+
+
+@njit(cache=True, nogil=True)
+def risk_exposure(sizes, price, equity):
+    """Gross mark-to-market exposure of the position book relative to equity"""
+    total = 0.0
+    for i in range(sizes.shape[0]):
+        total += abs(sizes[i] * price)
+    if equity <= 0.0:
+        return 1.0 if total > 0.0 else 0.0
+    return total / equity
+
+
+def warm_up():
+    """Compile every kernel ahead of the first tick
+
+    With cache=True the compiled artifacts persist on disk, so after the
+    first process this only pays the cost of loading them.
+    """
+    dummy = np.linspace(100.0, 101.0, 30)
+    scratch = np.empty(dummy.shape[0] - 1)
+    out = np.zeros(50)
+    sma(dummy, 10)
+    ema(dummy, 12)
+    rsi(dummy, 14)
+    macd(dummy)
+    bbands(dummy, 20)
+    vwap(dummy, dummy)
+    market_stats(dummy)
+    returns_stats(dummy, scratch, out)
+    risk_exposure(dummy, 100.0, 1000.0)
+
+
+class StreamingSMA:
+    """Simple moving average updated in O(1) per sample"""
+
+    def __init__(self, n: int):
+        self.n = n
+        self._window = deque(maxlen=n)
+        self._total = 0.0
+        self.value = 0.0
+
+    def update(self, price: float) -> float:
+        if len(self._window) == self.n:
+            self._total -= self._window[0]
+        self._window.append(price)
+        self._total += price
+        self.value = self._total / len(self._window)
+        return self.value
+
+
+class StreamingEMA:
+    """Exponential moving average updated in O(1) per sample"""
+
+    def __init__(self, n: int):
+        self.alpha = 2.0 / (n + 1.0)
+        self.value = 0.0
+        self._seeded = False
+
+    def update(self, price: float) -> float:
+        if not self._seeded:
+            self.value = price
+            self._seeded = True
+        else:
+            self.value = self.alpha * price + (1.0 - self.alpha) * self.value
+        return self.value
+
+
+class StreamingRSI:
+    """Wilder-smoothed RSI updated in O(1) per sample"""
+
+    def __init__(self, n: int):
+        self.n = n
+        self._prev = None
+        self._count = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self.value = 50.0
+
+    def update(self, price: float) -> float:
+        if self._prev is None:
+            self._prev = price
+            return self.value
+        change = price - self._prev
+        self._prev = price
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        self._count += 1
+        if self._count <= self.n:
+            self._avg_gain += gain / self.n
+            self._avg_loss += loss / self.n
+            if self._count < self.n:
+                return self.value
+        else:
+            self._avg_gain = (self._avg_gain * (self.n - 1) + gain) / self.n
+            self._avg_loss = (self._avg_loss * (self.n - 1) + loss) / self.n
+        if self._avg_loss == 0.0:
+            self.value = 100.0
+        else:
+            rs = self._avg_gain / self._avg_loss
+            self.value = 100.0 - 100.0 / (1.0 + rs)
+        return self.value
+
+
+class StreamingBBands:
+    """Bollinger bands over a rolling window using running sums"""
+
+    def __init__(self, n: int):
+        self.n = n
+        self._window = deque(maxlen=n)
+        self._total = 0.0
+        self._total_sq = 0.0
+        self.upper = 0.0
+        self.middle = 0.0
+        self.lower = 0.0
+
+    def update(self, price: float):
+        if len(self._window) == self.n:
+            old = self._window[0]
+            self._total -= old
+            self._total_sq -= old * old
+        self._window.append(price)
+        self._total += price
+        self._total_sq += price * price
+        count = len(self._window)
+        mean = self._total / count
+        var = max(self._total_sq / count - mean * mean, 0.0)
+        std = var ** 0.5
+        self.upper = mean + 2.0 * std
+        self.middle = mean
+        self.lower = mean - 2.0 * std
+        return self.upper, self.middle, self.lower
+
+
+class StreamingMACD:
+    """MACD line/signal/histogram from two streaming EMAs (12/26/9)"""
+
+    def __init__(self):
+        self._fast = StreamingEMA(12)
+        self._slow = StreamingEMA(26)
+        self._signal = StreamingEMA(9)
+        self.line = 0.0
+        self.signal = 0.0
+        self.histogram = 0.0
+
+    def update(self, price: float):
+        self.line = self._fast.update(price) - self._slow.update(price)
+        self.signal = self._signal.update(self.line)
+        self.histogram = self.line - self.signal
+        return self.line, self.signal, self.histogram
+
+
+class StreamingVWAP:
+    """Volume-weighted average price from running price*volume sums"""
+
+    def __init__(self):
+        self._pv = 0.0
+        self._v = 0.0
+        self.value = 0.0
+
+    def update(self, price: float, volume: float) -> float:
+        self._pv += price * volume
+        self._v += volume
+        if self._v > 0.0:
+            self.value = self._pv / self._v
+        return self.value
@@ -8,6 +8,7 @@ using the Solace Protocol Python SDK.
 
 import asyncio
 import logging
+import signal
 from typing import List
 
 # Import Solace Protocol SDK
@@ -170,17 +171,19 @@ async def main():
     # Start operations
     await agent.start_operations()
     
-    # Keep agent running
-    try:
-        logger.info("Agent is running. Press Ctrl+C to stop...")
-        while True:
-            await asyncio.sleep(10)
-            # Could add periodic tasks here (health checks, reputation updates, etc.)
-            
-    except KeyboardInterrupt:
-        logger.info("Stopping agent...")
-        await agent.agent.stop()
-        logger.info("Agent stopped successfully")
+    # Block on a shutdown signal instead of polling in a sleep loop;
+    # no periodic wakeups and Ctrl+C stops the agent immediately
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info("Agent is running. Press Ctrl+C to stop...")
+    await stop.wait()
+
+    logger.info("Stopping agent...")
+    await agent.agent.stop()
+    logger.info("Agent stopped successfully")
 
 
 if __name__ == "__main__":